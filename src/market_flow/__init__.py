@@ -24,6 +24,7 @@ from market_flow.deep_research import (
 
 from market_flow.drive_uploader import (
     upload_to_drive,
+    upload_bytes_to_drive,
     list_files_in_folder,
     delete_from_drive,
 )
@@ -75,6 +76,7 @@ __all__ = [
     "research_stream",
     # Drive Uploader
     "upload_to_drive",
+    "upload_bytes_to_drive",
     "list_files_in_folder",
     "delete_from_drive",
     # Market Data (FMP)
@@ -9,7 +9,7 @@ import os
 import time
 import tempfile
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 from google import genai
 from google.oauth2.credentials import Credentials
@@ -17,6 +17,9 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 
+if TYPE_CHECKING:
+    from fpdf import FPDF
+
 # Deep Research agent identifier
 DEEP_RESEARCH_AGENT = "deep-research-pro-preview-12-2025"
 
@@ -53,16 +56,15 @@ def _get_google_docs_credentials(credentials_path: str = "credentials.json") ->
     return creds
 
 
-def _generate_pdf(content: str, output_path: str) -> str:
+def _build_pdf(content: str) -> "FPDF":
     """
-    Generate a PDF from markdown/text content using fpdf2 (pure Python).
+    Lay out markdown/text content as an fpdf2 document (pure Python).
 
     Args:
         content: The text/markdown content.
-        output_path: Path for the output PDF.
 
     Returns:
-        The path to the generated PDF.
+        The rendered FPDF object, ready to be written out.
     """
     from fpdf import FPDF
     import re
@@ -148,10 +150,37 @@ def _generate_pdf(content: str, output_path: str) -> str:
             text = re.sub(r'\[cite: [\d, ]+\]', '', text)  # Remove citations
             pdf.multi_cell(0, 5, sanitize_text(text), new_x='LMARGIN', new_y='NEXT')
 
-    pdf.output(output_path)
+    return pdf
+
+
+def _generate_pdf(content: str, output_path: str) -> str:
+    """
+    Generate a PDF from markdown/text content using fpdf2 (pure Python).
+
+    Args:
+        content: The text/markdown content.
+        output_path: Path for the output PDF.
+
+    Returns:
+        The path to the generated PDF.
+    """
+    _build_pdf(content).output(output_path)
     return output_path
 
 
+def _generate_pdf_bytes(content: str) -> bytes:
+    """
+    Generate a PDF from markdown/text content in memory.
+
+    Args:
+        content: The text/markdown content.
+
+    Returns:
+        The PDF file contents.
+    """
+    return bytes(_build_pdf(content).output())
+
+
 def _create_google_doc(
     title: str,
     content: str,
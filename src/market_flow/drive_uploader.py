@@ -5,13 +5,14 @@ Uploads files to Google Drive with optional conversion to Google Docs format.
 Uses Application Default Credentials for seamless local and cloud deployment.
 """
 
+import io
 import os
 from pathlib import Path
 
 from google.auth import default
 from google.auth.exceptions import DefaultCredentialsError
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 
 # Scopes required for Drive API
 DRIVE_SCOPES = ['https://www.googleapis.com/auth/drive.file']
@@ -52,7 +53,8 @@ def upload_to_drive(
     folder_id: str | None = None,
     convert_to_doc: bool = True,
     delete_local: bool = False,
-    file_name: str | None = None
+    file_name: str | None = None,
+    service=None,
 ) -> dict:
     """
     Upload a file to Google Drive, optionally converting to Google Docs format.
@@ -63,6 +65,8 @@ def upload_to_drive(
         convert_to_doc: If True and file is PDF, convert to Google Doc.
         delete_local: If True, delete the local file after successful upload.
         file_name: Custom name for the file in Drive. If None, uses original filename.
+        service: Authenticated Drive service to reuse (e.g. one built ahead of
+                 time). If None, a new one is created.
 
     Returns:
         Dict containing:
@@ -89,25 +93,14 @@ def upload_to_drive(
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    service = _get_drive_service()
+    service = service or _get_drive_service()
 
     # Determine file name
     name = file_name or path.stem
 
-    # Build file metadata
-    file_metadata = {'name': name}
-
-    # Add parent folder if specified
-    if folder_id:
-        file_metadata['parents'] = [folder_id]
-
     # Determine MIME types
     local_mime = _get_mime_type(path)
 
-    # Convert PDF to Google Doc if requested
-    if convert_to_doc and local_mime == PDF_MIME:
-        file_metadata['mimeType'] = GOOGLE_DOC_MIME
-
     # Upload the file
     media = MediaFileUpload(
         str(path),
@@ -115,16 +108,78 @@ def upload_to_drive(
         resumable=True
     )
 
+    result = _create_file(service, name, folder_id, local_mime, convert_to_doc, media)
+
+    # Delete local file if requested
+    if delete_local:
+        path.unlink()
+
+    return result
+
+
+def upload_bytes_to_drive(
+    data: bytes,
+    file_name: str,
+    folder_id: str | None = None,
+    mime_type: str = PDF_MIME,
+    convert_to_doc: bool = True,
+    service=None,
+) -> dict:
+    """
+    Upload in-memory file contents to Google Drive without writing to disk.
+
+    Args:
+        data: File contents to upload.
+        file_name: Name for the file in Drive.
+        folder_id: Google Drive folder ID to upload to. If None, uploads to root.
+        mime_type: MIME type of the contents (default: PDF).
+        convert_to_doc: If True and the contents are a PDF, convert to Google Doc.
+        service: Authenticated Drive service to reuse (e.g. one built ahead of
+                 time). If None, a new one is created.
+
+    Returns:
+        Same dict as upload_to_drive (id, name, url, mimeType).
+
+    Raises:
+        DefaultCredentialsError: If no credentials are available.
+    """
+    service = service or _get_drive_service()
+
+    media = MediaIoBaseUpload(
+        io.BytesIO(data),
+        mimetype=mime_type,
+        resumable=True
+    )
+
+    return _create_file(service, file_name, folder_id, mime_type, convert_to_doc, media)
+
+
+def _create_file(
+    service,
+    name: str,
+    folder_id: str | None,
+    mime_type: str,
+    convert_to_doc: bool,
+    media,
+) -> dict:
+    """Create a Drive file from a media body of the given MIME type; return its summary."""
+    # Build file metadata
+    file_metadata = {'name': name}
+
+    # Add parent folder if specified
+    if folder_id:
+        file_metadata['parents'] = [folder_id]
+
+    # Convert PDF to Google Doc if requested
+    if convert_to_doc and mime_type == PDF_MIME:
+        file_metadata['mimeType'] = GOOGLE_DOC_MIME
+
     uploaded_file = service.files().create(
         body=file_metadata,
         media_body=media,
         fields='id, name, mimeType, webViewLink'
     ).execute()
 
-    # Delete local file if requested
-    if delete_local:
-        path.unlink()
-
     return {
         'id': uploaded_file['id'],
         'name': uploaded_file['name'],
@@ -5,7 +5,11 @@ Wrapper around the FMP API for fetching financial data.
 Uses the stable API endpoints (not legacy v3).
 """
 
+import copy
 import os
+import threading
+import time
+from concurrent.futures import Future
 from typing import Literal
 
 import requests
@@ -13,6 +17,22 @@ import requests
 
 FMP_BASE_URL = "https://financialmodelingprep.com/stable"
 
+# How long a cached response is served before hitting the API again (seconds)
+CACHE_TTL_SECONDS = 600
+
+# TTM ratios are refreshed at most daily, so they can be cached much longer
+RATIOS_TTM_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Quotes drive prices and upside, so they are only shared between near-simultaneous calls
+QUOTE_CACHE_TTL_SECONDS = 5
+
+# (endpoint, params) -> (expiry time, response data)
+_response_cache: dict[tuple, tuple[float, dict | list]] = {}
+
+# (endpoint, params) -> result of a request currently on the wire
+_in_flight: dict[tuple, Future] = {}
+_in_flight_lock = threading.Lock()
+
 
 def _get_api_key() -> str:
     """Get the FMP API key from environment."""
@@ -25,15 +45,71 @@ def _get_api_key() -> str:
     return api_key
 
 
-def _make_request(endpoint: str, params: dict | None = None) -> dict | list:
-    """Make a request to the FMP stable API."""
-    api_key = _get_api_key()
-
+def _make_request(
+    endpoint: str,
+    params: dict | None = None,
+    ttl: float = CACHE_TTL_SECONDS,
+) -> dict | list:
+    """
+    Make a request to the FMP stable API.
+
+    Successful responses are cached for `ttl` seconds so repeated lookups
+    (sensitivity re-runs, several models on one ticker) skip the network.
+    Identical requests made while one is already in flight (e.g. a workflow
+    and the model it runs fetching the same statements) wait for that
+    request instead of issuing their own.
+    Each caller gets its own copy of the response records.
+    """
     params = params or {}
-    params["apikey"] = api_key
+    cache_key = (endpoint, tuple(sorted(params.items())))
+
+    with _in_flight_lock:
+        cached = _response_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return _copy_response(cached[1])
+
+        pending = _in_flight.get(cache_key)
+        is_owner = pending is None
+        if is_owner:
+            pending = _in_flight[cache_key] = Future()
+
+    if not is_owner:
+        return _copy_response(pending.result())
+
+    try:
+        data = _fetch(endpoint, params)
+        _store_response(cache_key, data, ttl)
+        pending.set_result(data)
+        return _copy_response(data)
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[cache_key]
+
+
+def _store_response(cache_key: tuple, data: dict | list, ttl: float) -> None:
+    """Cache a response, dropping any entries that have already expired."""
+    now = time.monotonic()
+    with _in_flight_lock:
+        expired = [key for key, (expiry, _) in _response_cache.items() if expiry <= now]
+        for key in expired:
+            del _response_cache[key]
+        _response_cache[cache_key] = (now + ttl, data)
+
+
+def _copy_response(data: dict | list) -> dict | list:
+    """Deep-copy a cached response so callers can modify it without affecting the cache."""
+    return copy.deepcopy(data)
+
+
+def _fetch(endpoint: str, params: dict) -> dict | list:
+    """Issue a single uncached request to the FMP stable API."""
+    api_key = _get_api_key()
 
     url = f"{FMP_BASE_URL}/{endpoint}"
-    response = requests.get(url, params=params, timeout=30)
+    response = requests.get(url, params={**params, "apikey": api_key}, timeout=30)
     response.raise_for_status()
 
     data = response.json()
@@ -44,6 +120,12 @@ def _make_request(endpoint: str, params: dict | None = None) -> dict | list:
     return data
 
 
+def clear_cache() -> None:
+    """Discard all cached FMP responses."""
+    with _in_flight_lock:
+        _response_cache.clear()
+
+
 def get_company_profile(ticker: str) -> dict:
     """
     Get company profile information.
@@ -195,7 +277,11 @@ def get_ratios_ttm(ticker: str) -> dict:
         - assetTurnoverTTM, inventoryTurnoverTTM, receivablesTurnoverTTM
         - effectiveTaxRateTTM, financialLeverageRatioTTM
     """
-    data = _make_request("ratios-ttm", params={"symbol": ticker.upper()})
+    data = _make_request(
+        "ratios-ttm",
+        params={"symbol": ticker.upper()},
+        ttl=RATIOS_TTM_CACHE_TTL_SECONDS,
+    )
     if not data:
         raise ValueError(f"No TTM ratios found for ticker: {ticker}")
     return data[0] if isinstance(data, list) else data
@@ -266,7 +352,11 @@ def get_quote(ticker: str) -> dict:
         - yearHigh, yearLow
         - sharesOutstanding
     """
-    data = _make_request("quote", params={"symbol": ticker.upper()})
+    data = _make_request(
+        "quote",
+        params={"symbol": ticker.upper()},
+        ttl=QUOTE_CACHE_TTL_SECONDS,
+    )
     if not data:
         raise ValueError(f"No quote found for ticker: {ticker}")
     return data[0] if isinstance(data, list) else data
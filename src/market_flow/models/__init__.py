@@ -12,6 +12,7 @@ from .dcf_model import (
     calculate_terminal_value,
     calculate_intrinsic_value,
     build_dcf_model,
+    build_dcf_batch,
     DCFResult,
 )
 
@@ -35,6 +36,7 @@ __all__ = [
     "calculate_terminal_value",
     "calculate_intrinsic_value",
     "build_dcf_model",
+    "build_dcf_batch",
     "DCFResult",
     # CBCV Model
     "calculate_clv",
@@ -83,7 +83,7 @@ TICKER_INDUSTRY_MAP: dict[str, str] = {
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CBCVResult:
     """Result of Customer-Based Corporate Valuation."""
 
@@ -124,9 +124,9 @@ class CBCVResult:
     upside_percentage: float
 
     # Projections
-    projected_customers: list[int] = field(default_factory=list)
-    projected_revenue: list[float] = field(default_factory=list)
-    projected_acquisition: list[int] = field(default_factory=list)
+    projected_customers: tuple[int, ...] = ()
+    projected_revenue: tuple[float, ...] = ()
+    projected_acquisition: tuple[int, ...] = ()
 
     # Metadata
     assumptions: dict = field(default_factory=dict)
@@ -209,10 +209,10 @@ def get_cbcv_financial_inputs(ticker: str) -> dict[str, Any]:
         gross_profit = stmt.get("grossProfit", 0)
         gross_margin = gross_profit / revenue if revenue > 0 else 0.5
         # S&M expense - try different field names
-        sm_expense = (
-            stmt.get("sellingAndMarketingExpenses", 0)
-            or stmt.get("sellingGeneralAndAdministrativeExpenses", 0) * 0.5  # Estimate S&M as 50% of SG&A
-        )
+        sm_expense = stmt.get("sellingAndMarketingExpenses")
+        if not sm_expense:
+            # Estimate S&M as 50% of SG&A
+            sm_expense = (stmt.get("sellingGeneralAndAdministrativeExpenses") or 0) * 0.5
     else:
         revenue = 0
         gross_margin = 0.5
@@ -235,12 +235,12 @@ def get_cbcv_financial_inputs(ticker: str) -> dict[str, Any]:
     else:
         shares_outstanding = quote.get("sharesOutstanding", 0) if quote else 0
 
-    # Calculate WACC
+    # Calculate WACC (falls back to a default debt ratio if TTM ratios are unavailable)
     wacc_result = calculate_wacc(
         beta=beta,
         ticker=ticker,
     )
-    wacc = wacc_result.get("wacc", 0.10)
+    wacc = wacc_result["wacc"]
 
     return {
         "company_name": company_name,
@@ -399,27 +399,38 @@ def calculate_future_customer_equity(
     cumulative_customers = current_customers
     current_acquisition = annual_new_customers
 
+    # Running factors replace the per-year (1 - decay) ** (year - 1) and
+    # (1 + r) ** year power calls
+    decay_factor = 1.0
+    discount_factor = 1.0
+
     for year in range(1, projection_years + 1):
         # Check TAM constraint
         if tam and cumulative_customers >= tam:
             current_acquisition = 0
 
         # Calculate this year's acquisition (with decay)
-        year_acquisition = int(current_acquisition * ((1 - acquisition_decay) ** (year - 1)))
+        year_acquisition = int(current_acquisition * decay_factor)
 
         # Apply TAM cap if set
         if tam:
             year_acquisition = min(year_acquisition, tam - cumulative_customers)
             year_acquisition = max(0, year_acquisition)
 
+        if year_acquisition == 0:
+            # Acquisition decays from the prior year's value, so once it
+            # reaches zero every remaining year is zero as well
+            projected_acquisitions.extend([0] * (projection_years - year + 1))
+            break
+
         projected_acquisitions.append(year_acquisition)
         cumulative_customers += year_acquisition
 
         # Discount to present value
-        year_value = year_acquisition * value_per_new_customer
-        pv = year_value / ((1 + discount_rate) ** year)
-        total_future_equity += pv
+        discount_factor *= 1 + discount_rate
+        total_future_equity += year_acquisition * value_per_new_customer / discount_factor
 
+        decay_factor *= 1 - acquisition_decay
         current_acquisition = year_acquisition  # Update for decay calculation
 
     return total_future_equity, projected_acquisitions
@@ -511,9 +522,11 @@ def build_cbcv_model(
     industry = get_industry_for_ticker(ticker)
 
     # Calculate or use provided ARPU
+    arpu_calculated = False
     if arpu is None:
         if total_customers > 0 and revenue > 0:
             arpu = revenue / total_customers
+            arpu_calculated = True
         else:
             raise ValueError("ARPU must be provided or calculable from revenue/customers")
 
@@ -549,16 +562,20 @@ def build_cbcv_model(
     existing_ce = calculate_existing_customer_equity(total_customers, clv)
 
     # Calculate future customer equity
-    future_ce, projected_acquisition = calculate_future_customer_equity(
-        annual_new_customers=new_customers,
-        clv=clv,
-        cac=cac,
-        discount_rate=wacc,
-        projection_years=projection_years,
-        acquisition_decay=0.10,
-        tam=tam,
-        current_customers=total_customers,
-    )
+    if clv <= cac:
+        # New customers destroy value, so there is nothing to project
+        future_ce, projected_acquisition = 0, [0] * projection_years
+    else:
+        future_ce, projected_acquisition = calculate_future_customer_equity(
+            annual_new_customers=new_customers,
+            clv=clv,
+            cac=cac,
+            discount_rate=wacc,
+            projection_years=projection_years,
+            acquisition_decay=0.10,
+            tam=tam,
+            current_customers=total_customers,
+        )
 
     # Total customer equity = enterprise value
     total_ce = existing_ce + future_ce
@@ -583,13 +600,12 @@ def build_cbcv_model(
     projected_customers = [total_customers]
     projected_revenue = [total_customers * arpu]
 
-    for i, acq in enumerate(projected_acquisition):
+    customers = total_customers
+    for acq in projected_acquisition:
         # Simple projection: existing × retention + new
-        prev_customers = projected_customers[-1]
-        retained = int(prev_customers * retention_rate)
-        new_total = retained + acq
-        projected_customers.append(new_total)
-        projected_revenue.append(new_total * arpu)
+        customers = int(customers * retention_rate) + acq
+        projected_customers.append(customers)
+        projected_revenue.append(customers * arpu)
 
     # Build sensitivity matrix
     sensitivity = build_sensitivity_matrix(clv, arpu, gross_margin, retention_rate, wacc)
@@ -597,7 +613,7 @@ def build_cbcv_model(
     # Compile assumptions
     assumptions = {
         "arpu": arpu,
-        "arpu_source": "calculated" if arpu == revenue / total_customers else "provided",
+        "arpu_source": "calculated" if arpu_calculated else "provided",
         "churn_rate": churn_rate,
         "churn_source": "industry_benchmark" if churn_rate == get_churn_rate_benchmark(ticker) else "provided",
         "retention_rate": retention_rate,
@@ -635,9 +651,9 @@ def build_cbcv_model(
         equity_value=equity_value,
         intrinsic_value_per_share=intrinsic_value,
         upside_percentage=upside,
-        projected_customers=projected_customers,
-        projected_revenue=projected_revenue,
-        projected_acquisition=projected_acquisition,
+        projected_customers=tuple(projected_customers),
+        projected_revenue=tuple(projected_revenue),
+        projected_acquisition=tuple(projected_acquisition),
         assumptions=assumptions,
         sensitivity_matrix=sensitivity,
     )
@@ -4,7 +4,9 @@ Discounted Cash Flow (DCF) Model
 This module provides DCF valuation calculations for company analysis.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import chain, islice, repeat
 from typing import Any
 
 from ..market_data.fmp_client import (
@@ -18,7 +20,7 @@ from ..market_data.fmp_client import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class DCFResult:
     """Container for DCF model results."""
 
@@ -49,7 +51,7 @@ class DCFResult:
     net_debt: float
 
     # Supporting data
-    historical_fcf: list[dict] = field(default_factory=list)
+    historical_fcf: tuple[dict, ...] = ()
     assumptions: dict = field(default_factory=dict)
     sensitivity_matrix: dict = field(default_factory=dict)
 
@@ -104,21 +106,25 @@ def calculate_wacc(
         ticker: Optional stock ticker to auto-fetch debt ratio from TTM ratios
 
     Returns:
-        dict with WACC components and final WACC
+        dict with WACC components and final WACC. "debt_ratio_source" says
+        where the debt weight came from: "provided", "ttm" or "default".
     """
-    # Auto-fetch debt ratio from TTM ratios if ticker provided and debt_ratio not specified
+    debt_ratio_source = "provided"
+
+    # Auto-fetch debt ratio from TTM ratios if ticker provided and debt_ratio not specified.
+    # A failed fetch is retried on the next call; a ticker FMP has no TTM data
+    # for is answered from the FMP client's response cache.
+    if debt_ratio is None and ticker:
+        try:
+            # Use debtToCapitalRatioTTM = D/(D+E) for proper WACC weights
+            debt_ratio = get_ratios_ttm(ticker).get("debtToCapitalRatioTTM")
+            debt_ratio_source = "ttm"
+        except Exception:
+            pass
+
     if debt_ratio is None:
-        if ticker:
-            try:
-                ttm_ratios = get_ratios_ttm(ticker)
-                # Use debtToCapitalRatioTTM = D/(D+E) for proper WACC weights
-                debt_ratio = ttm_ratios.get("debtToCapitalRatioTTM", 0.3)
-                if debt_ratio is None:
-                    debt_ratio = 0.3
-            except Exception:
-                debt_ratio = 0.3  # Fallback if API fails
-        else:
-            debt_ratio = 0.3  # Default if no ticker provided
+        debt_ratio = 0.3  # Default if no ticker, no TTM value, or the fetch failed
+        debt_ratio_source = "default"
 
     # Cost of Equity using CAPM
     cost_of_equity = risk_free_rate + beta * market_premium
@@ -139,6 +145,7 @@ def calculate_wacc(
         "after_tax_cost_of_debt": after_tax_cost_of_debt,
         "tax_rate": tax_rate,
         "debt_weight": debt_ratio,
+        "debt_ratio_source": debt_ratio_source,
         "equity_weight": equity_ratio,
         "beta": beta,
         "risk_free_rate": risk_free_rate,
@@ -163,19 +170,19 @@ def project_free_cash_flows(
         List of projected FCFs for each year
     """
     if isinstance(growth_rates, (int, float)):
-        growth_rates = [growth_rates] * years
-
-    if len(growth_rates) < years:
+        rates = repeat(growth_rates, years)
+    elif len(growth_rates) < years:
         # Extend with last rate if not enough provided
-        growth_rates = list(growth_rates) + [growth_rates[-1]] * (
-            years - len(growth_rates)
-        )
+        rates = chain(growth_rates, repeat(growth_rates[-1], years - len(growth_rates)))
+    else:
+        rates = islice(growth_rates, years)
 
+    # Cumulative product of (1 + g), streamed without building a padded rate list
     projected = []
     current_fcf = base_fcf
 
-    for i in range(years):
-        current_fcf = current_fcf * (1 + growth_rates[i])
+    for rate in rates:
+        current_fcf *= 1 + rate
         projected.append(current_fcf)
 
     return projected
@@ -205,12 +212,24 @@ def calculate_terminal_value(
     return (final_fcf * (1 + perpetual_growth)) / (wacc - perpetual_growth)
 
 
+def _discount_factors(wacc: float, years: int) -> list[float]:
+    """Cumulative discount factors (1 + wacc)^1 .. (1 + wacc)^years."""
+    factors = []
+    discount_factor = 1.0
+    for _ in range(years):
+        discount_factor *= 1 + wacc
+        factors.append(discount_factor)
+    return factors
+
+
 def calculate_intrinsic_value(
     projected_fcfs: list[float],
     terminal_value: float,
     wacc: float,
     shares_outstanding: float,
     net_debt: float = 0,
+    return_components: bool = True,
+    discount_factors: list[float] | None = None,
 ) -> dict:
     """
     Calculate intrinsic value per share.
@@ -221,22 +240,37 @@ def calculate_intrinsic_value(
         wacc: Weighted average cost of capital
         shares_outstanding: Number of shares outstanding
         net_debt: Net debt (Total Debt - Cash)
+        return_components: Include the per-year discounted FCFs as "pv_fcfs"
+        discount_factors: Precomputed factors for wacc (see _discount_factors),
+                          one per projected FCF
 
     Returns:
         dict with enterprise value, equity value, and per-share value
+
+    Raises:
+        ValueError: If discount_factors does not have one factor per projected FCF
     """
+    if discount_factors is None:
+        discount_factors = _discount_factors(wacc, len(projected_fcfs))
+    elif len(discount_factors) != len(projected_fcfs):
+        raise ValueError(
+            f"Expected {len(projected_fcfs)} discount factors, got {len(discount_factors)}"
+        )
+
     # Discount projected FCFs
     pv_fcfs = []
-    for i, fcf in enumerate(projected_fcfs):
-        discount_factor = (1 + wacc) ** (i + 1)
-        pv_fcfs.append(fcf / discount_factor)
+    pv_fcf_sum = 0.0
+    for fcf, discount_factor in zip(projected_fcfs, discount_factors):
+        pv_fcf = fcf / discount_factor
+        pv_fcf_sum += pv_fcf
+        if return_components:
+            pv_fcfs.append(pv_fcf)
 
-    # Discount terminal value
-    final_year = len(projected_fcfs)
-    pv_terminal = terminal_value / ((1 + wacc) ** final_year)
+    # Discount terminal value with the final year's factor
+    pv_terminal = terminal_value / (discount_factors[-1] if discount_factors else 1.0)
 
     # Enterprise value
-    enterprise_value = sum(pv_fcfs) + pv_terminal
+    enterprise_value = pv_fcf_sum + pv_terminal
 
     # Equity value (subtract net debt)
     equity_value = enterprise_value - net_debt
@@ -244,13 +278,14 @@ def calculate_intrinsic_value(
     # Per share value
     intrinsic_value_per_share = equity_value / shares_outstanding
 
-    return {
-        "pv_fcfs": pv_fcfs,
-        "pv_terminal_value": pv_terminal,
-        "enterprise_value": enterprise_value,
-        "equity_value": equity_value,
-        "intrinsic_value_per_share": intrinsic_value_per_share,
-    }
+    result = {"pv_fcfs": pv_fcfs} if return_components else {}
+    result.update(
+        pv_terminal_value=pv_terminal,
+        enterprise_value=enterprise_value,
+        equity_value=equity_value,
+        intrinsic_value_per_share=intrinsic_value_per_share,
+    )
+    return result
 
 
 def _calculate_historical_growth(values: list[float]) -> float:
@@ -268,6 +303,158 @@ def _calculate_historical_growth(values: list[float]) -> float:
     return (ending / beginning) ** (1 / years) - 1
 
 
+def _sensitivity_grid(
+    projected_fcfs: list[float],
+    wacc_range: list[float],
+    growth_range: list[float],
+    shares_outstanding: float,
+    net_debt: float,
+    discount_factors: list[list[float]] | None = None,
+) -> list[list[float]]:
+    """
+    Compute intrinsic value per share for each WACC / terminal growth pair.
+
+    Pure numeric kernel: rows follow wacc_range and columns follow
+    growth_range. The discounted FCF stream depends only on WACC, so it is
+    computed once per row and shared by every growth rate in that row.
+    discount_factors, if given, holds one _discount_factors list per WACC.
+    """
+    # Validate the whole sweep up front so the Gordon Growth formula can be
+    # applied inline without per-cell checks
+    if wacc_range and growth_range:
+        min_wacc, max_growth = min(wacc_range), max(growth_range)
+        if min_wacc <= max_growth:
+            raise ValueError(
+                f"WACC ({min_wacc:.2%}) must be greater than perpetual growth rate ({max_growth:.2%})"
+            )
+
+    if discount_factors is None:
+        discount_factors = [_discount_factors(w, len(projected_fcfs)) for w in wacc_range]
+
+    final_fcf = projected_fcfs[-1]
+    grid = []
+
+    for w, factors in zip(wacc_range, discount_factors):
+        pv_fcf_sum = 0
+        for fcf, discount_factor in zip(projected_fcfs, factors):
+            pv_fcf_sum += fcf / discount_factor
+
+        # Terminal value is discounted with the final year's factor
+        terminal_factor = factors[-1]
+
+        row = []
+        for g in growth_range:
+            tv = (final_fcf * (1 + g)) / (w - g)
+            enterprise_value = pv_fcf_sum + tv / terminal_factor
+            row.append((enterprise_value - net_debt) / shares_outstanding)
+        grid.append(row)
+
+    return grid
+
+
+def _build_sensitivity_matrix(
+    projected_fcfs: list[float],
+    wacc_range: list[float],
+    growth_range: list[float],
+    shares_outstanding: float,
+    net_debt: float,
+    discount_factors: list[list[float]] | None = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Build intrinsic value per share across WACC and terminal growth rates.
+
+    Returns:
+        Nested dict: wacc -> terminal growth -> intrinsic value per share
+    """
+    grid = _sensitivity_grid(
+        projected_fcfs, wacc_range, growth_range, shares_outstanding, net_debt, discount_factors
+    )
+
+    # Column labels are shared by every row, so format them once
+    growth_labels = [f"{g:.1%}" for g in growth_range]
+
+    return {
+        f"{w:.1%}": {label: round(value, 2) for label, value in zip(growth_labels, row)}
+        for w, row in zip(wacc_range, grid)
+    }
+
+
+@dataclass(slots=True)
+class _FinancialsView:
+    """Latest-period statement values used by build_dcf_model, with missing fields defaulted."""
+
+    total_debt: float
+    cash: float
+    interest_expense: float
+    income_before_tax: float
+    income_tax_expense: float
+    free_cash_flow: float
+    operating_cash_flow: float
+    capital_expenditure: float
+
+
+def _latest_financials(
+    balance_sheets: list[dict],
+    income_statements: list[dict],
+    cash_flows: list[dict],
+) -> _FinancialsView:
+    """Pull the latest statement values once; missing statements read as empty."""
+    latest_bs = balance_sheets[0] if balance_sheets else {}
+    latest_income = income_statements[0] if income_statements else {}
+    latest_cf = cash_flows[0] if cash_flows else {}
+
+    return _FinancialsView(
+        total_debt=latest_bs.get("totalDebt") or 0,
+        cash=latest_bs.get("cashAndCashEquivalents") or 0,
+        interest_expense=abs(latest_income.get("interestExpense") or 0),
+        income_before_tax=latest_income.get("incomeBeforeTax") or 1,
+        income_tax_expense=latest_income.get("incomeTaxExpense") or 0,
+        free_cash_flow=latest_cf.get("freeCashFlow") or 0,
+        operating_cash_flow=latest_cf.get("operatingCashFlow") or 0,
+        capital_expenditure=abs(latest_cf.get("capitalExpenditure") or 0),
+    )
+
+
+def _fetch_dcf_inputs(
+    ticker: str,
+    concurrent: bool = True,
+) -> tuple[dict, list[dict], list[dict], list[dict], dict]:
+    """
+    Fetch the FMP data build_dcf_model needs.
+
+    The independent requests are issued concurrently unless concurrent is
+    False (build_dcf_batch already runs one ticker per worker). Responses
+    come from the FMP client's cache when warm, so re-running a model with
+    different assumptions does not hit the network again.
+
+    Returns:
+        (profile, income_statements, cash_flows, balance_sheets, quote)
+    """
+    if not concurrent:
+        return (
+            get_company_profile(ticker),
+            get_income_statement(ticker, period="annual", limit=5),
+            get_cash_flow(ticker, period="annual", limit=5),
+            get_balance_sheet(ticker, period="annual", limit=5),
+            get_quote(ticker),
+        )
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        profile_future = executor.submit(get_company_profile, ticker)
+        income_future = executor.submit(get_income_statement, ticker, period="annual", limit=5)
+        cash_flow_future = executor.submit(get_cash_flow, ticker, period="annual", limit=5)
+        balance_future = executor.submit(get_balance_sheet, ticker, period="annual", limit=5)
+        quote_future = executor.submit(get_quote, ticker)
+
+    return (
+        profile_future.result(),
+        income_future.result(),
+        cash_flow_future.result(),
+        balance_future.result(),
+        quote_future.result(),
+    )
+
+
 def build_dcf_model(
     ticker: str,
     projection_years: int = 5,
@@ -275,6 +462,7 @@ def build_dcf_model(
     risk_free_rate: float = 0.045,
     market_premium: float = 0.055,
     custom_growth_rate: float | None = None,
+    compute_sensitivity: bool = True,
 ) -> DCFResult:
     """
     Build a complete DCF model for a company.
@@ -288,45 +476,63 @@ def build_dcf_model(
         risk_free_rate: Risk-free rate for WACC (default: 4.5%)
         market_premium: Equity risk premium (default: 5.5%)
         custom_growth_rate: Override calculated growth rate if provided
+        compute_sensitivity: Build the WACC / terminal growth sensitivity
+                             matrix (default: True); when False it is left empty
 
     Returns:
         DCFResult with complete model data
     """
     ticker = ticker.upper()
 
-    # Fetch data from FMP
-    profile = get_company_profile(ticker)
-    income_statements = get_income_statement(ticker, period="annual", limit=5)
-    cash_flows = get_cash_flow(ticker, period="annual", limit=5)
-    balance_sheets = get_balance_sheet(ticker, period="annual", limit=5)
-    quote = get_quote(ticker)
+    return _build_dcf_model(
+        ticker,
+        _fetch_dcf_inputs(ticker),
+        projection_years=projection_years,
+        terminal_growth_rate=terminal_growth_rate,
+        risk_free_rate=risk_free_rate,
+        market_premium=market_premium,
+        custom_growth_rate=custom_growth_rate,
+        compute_sensitivity=compute_sensitivity,
+    )
+
+
+def _build_dcf_model(
+    ticker: str,
+    inputs: tuple[dict, list[dict], list[dict], list[dict], dict],
+    projection_years: int,
+    terminal_growth_rate: float,
+    risk_free_rate: float,
+    market_premium: float,
+    custom_growth_rate: float | None,
+    compute_sensitivity: bool,
+) -> DCFResult:
+    """Build a DCF model from _fetch_dcf_inputs data (see build_dcf_model)."""
+    profile, income_statements, cash_flows, balance_sheets, quote = inputs
+
+    # Pull the latest statement values up front
+    latest = _latest_financials(balance_sheets, income_statements, cash_flows)
 
     # Extract key values
     company_name = profile.get("companyName", ticker)
-    beta = profile.get("beta", 1.0) or 1.0
+    beta = profile.get("beta") or 1.0
     current_price = quote.get("price", 0)
     # Calculate shares outstanding from market cap if not directly available
     shares_outstanding = quote.get("sharesOutstanding", 0)
     if not shares_outstanding and current_price > 0:
-        market_cap = quote.get("marketCap", 0) or profile.get("marketCap", 0)
+        market_cap = quote.get("marketCap") or profile.get("marketCap", 0)
         shares_outstanding = market_cap / current_price if market_cap else 0
 
     # Get most recent balance sheet data
-    latest_bs = balance_sheets[0] if balance_sheets else {}
-    total_debt = latest_bs.get("totalDebt", 0) or 0
-    cash = latest_bs.get("cashAndCashEquivalents", 0) or 0
-    net_debt = total_debt - cash
+    total_debt = latest.total_debt
+    net_debt = total_debt - latest.cash
 
     # Estimate cost of debt from interest expense
-    latest_income = income_statements[0] if income_statements else {}
-    interest_expense = abs(latest_income.get("interestExpense", 0) or 0)
-    cost_of_debt = (interest_expense / total_debt) if total_debt > 0 else 0.06
+    cost_of_debt = (latest.interest_expense / total_debt) if total_debt > 0 else 0.06
     cost_of_debt = max(0.03, min(cost_of_debt, 0.15))  # Bound between 3% and 15%
 
     # Get tax rate
-    income_before_tax = latest_income.get("incomeBeforeTax", 0) or 1
-    income_tax = latest_income.get("incomeTaxExpense", 0) or 0
-    tax_rate = (income_tax / income_before_tax) if income_before_tax > 0 else 0.21
+    income_before_tax = latest.income_before_tax
+    tax_rate = (latest.income_tax_expense / income_before_tax) if income_before_tax > 0 else 0.21
     tax_rate = max(0, min(tax_rate, 0.4))  # Bound between 0% and 40%
 
     # Calculate WACC (auto-fetches debt ratio from TTM ratios via ticker)
@@ -339,20 +545,17 @@ def build_dcf_model(
         ticker=ticker,
     )
 
-    # Get historical FCF
+    # Get historical FCF and, in the same pass, the positive values used for growth
     historical_fcf = []
+    fcf_values = []
     for cf in reversed(cash_flows):  # Oldest to newest
-        fcf = cf.get("freeCashFlow", 0)
+        fcf = cf.get("freeCashFlow")
         if fcf:
-            historical_fcf.append(
-                {
-                    "year": cf.get("calendarYear", ""),
-                    "fcf": fcf,
-                }
-            )
+            historical_fcf.append({"year": cf.get("calendarYear", ""), "fcf": fcf})
+            if fcf > 0:
+                fcf_values.append(fcf)
 
     # Calculate growth rate from historical data or use custom
-    fcf_values = [h["fcf"] for h in historical_fcf if h["fcf"] > 0]
     if custom_growth_rate is not None:
         growth_rate = custom_growth_rate
     elif len(fcf_values) >= 2:
@@ -363,12 +566,10 @@ def build_dcf_model(
         growth_rate = 0.08  # Default 8%
 
     # Get base FCF (most recent)
-    base_fcf = cash_flows[0].get("freeCashFlow", 0) if cash_flows else 0
+    base_fcf = latest.free_cash_flow
     if base_fcf <= 0:
         # If FCF is negative, use operating cash flow minus average capex
-        base_fcf = cash_flows[0].get("operatingCashFlow", 0) or 0
-        capex = abs(cash_flows[0].get("capitalExpenditure", 0) or 0)
-        base_fcf = base_fcf - capex
+        base_fcf = latest.operating_cash_flow - latest.capital_expenditure
 
     # Project FCFs
     projected_fcfs = project_free_cash_flows(
@@ -384,6 +585,8 @@ def build_dcf_model(
         wacc=wacc_result["wacc"],
     )
 
+    base_discount_factors = _discount_factors(wacc_result["wacc"], len(projected_fcfs))
+
     # Calculate intrinsic value
     valuation = calculate_intrinsic_value(
         projected_fcfs=projected_fcfs,
@@ -391,27 +594,27 @@ def build_dcf_model(
         wacc=wacc_result["wacc"],
         shares_outstanding=shares_outstanding,
         net_debt=net_debt,
+        return_components=False,
+        discount_factors=base_discount_factors,
     )
 
     intrinsic_value = valuation["intrinsic_value_per_share"]
     upside = ((intrinsic_value - current_price) / current_price * 100) if current_price > 0 else 0
 
-    # Build sensitivity matrix
-    wacc_range = [wacc_result["wacc"] - 0.02, wacc_result["wacc"], wacc_result["wacc"] + 0.02]
-    growth_range = [terminal_growth_rate - 0.01, terminal_growth_rate, terminal_growth_rate + 0.01]
-
+    # Build sensitivity matrix; the middle WACC row reuses the base-case factors
     sensitivity_matrix = {}
-    for w in wacc_range:
-        w_key = f"{w:.1%}"
-        sensitivity_matrix[w_key] = {}
-        for g in growth_range:
-            tv = calculate_terminal_value(projected_fcfs[-1], g, w)
-            val = calculate_intrinsic_value(
-                projected_fcfs, tv, w, shares_outstanding, net_debt
-            )
-            sensitivity_matrix[w_key][f"{g:.1%}"] = round(
-                val["intrinsic_value_per_share"], 2
-            )
+    if compute_sensitivity:
+        wacc_range = [wacc_result["wacc"] - 0.02, wacc_result["wacc"], wacc_result["wacc"] + 0.02]
+        growth_range = [terminal_growth_rate - 0.01, terminal_growth_rate, terminal_growth_rate + 0.01]
+        discount_factors = [
+            _discount_factors(wacc_range[0], len(projected_fcfs)),
+            base_discount_factors,
+            _discount_factors(wacc_range[2], len(projected_fcfs)),
+        ]
+
+        sensitivity_matrix = _build_sensitivity_matrix(
+            projected_fcfs, wacc_range, growth_range, shares_outstanding, net_debt, discount_factors
+        )
 
     # Build assumptions dict
     assumptions = {
@@ -421,6 +624,7 @@ def build_dcf_model(
         "risk_free_rate": risk_free_rate,
         "market_premium": market_premium,
         "beta": beta,
+        "debt_ratio_source": wacc_result["debt_ratio_source"],
         "projection_years": projection_years,
     }
 
@@ -444,12 +648,68 @@ def build_dcf_model(
         enterprise_value=valuation["enterprise_value"],
         shares_outstanding=shares_outstanding,
         net_debt=net_debt,
-        historical_fcf=historical_fcf,
+        historical_fcf=tuple(historical_fcf),
         assumptions=assumptions,
         sensitivity_matrix=sensitivity_matrix,
     )
 
 
+def build_dcf_batch(
+    tickers: list[str],
+    projection_years: int = 5,
+    terminal_growth_rate: float = 0.025,
+    risk_free_rate: float = 0.045,
+    market_premium: float = 0.055,
+    max_workers: int = 8,
+    compute_sensitivity: bool = True,
+) -> list[DCFResult | Exception]:
+    """
+    Build DCF models for many tickers (screening / portfolio mode).
+
+    Each model's runtime is dominated by its FMP requests rather than the
+    valuation math, so tickers are built concurrently and share the FMP
+    client's response cache. Each worker fetches its ticker's data
+    sequentially, so at most max_workers requests are in flight.
+
+    Args:
+        tickers: Stock ticker symbols
+        projection_years: Number of years to project (default: 5)
+        terminal_growth_rate: Long-term growth rate (default: 2.5%)
+        risk_free_rate: Risk-free rate for WACC (default: 4.5%)
+        market_premium: Equity risk premium (default: 5.5%)
+        max_workers: Maximum number of tickers built at once (default: 8)
+        compute_sensitivity: Build each model's sensitivity matrix (default: True)
+
+    Returns:
+        List in the same order as tickers, holding each ticker's DCFResult,
+        or the exception raised while building it (e.g. no quote, or WACC
+        not above the terminal growth rate)
+    """
+    def build(ticker: str) -> DCFResult:
+        ticker = ticker.upper()
+        return _build_dcf_model(
+            ticker,
+            _fetch_dcf_inputs(ticker, concurrent=False),
+            projection_years=projection_years,
+            terminal_growth_rate=terminal_growth_rate,
+            risk_free_rate=risk_free_rate,
+            market_premium=market_premium,
+            custom_growth_rate=None,
+            compute_sensitivity=compute_sensitivity,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(build, ticker) for ticker in tickers]
+
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
 # =============================================================================
 # Custom DCF Parameter Calculation Helpers
 # =============================================================================
@@ -525,6 +785,29 @@ COUNTRY_GDP_GROWTH = {
     "Emerging": 4.5,
 }
 
+# Lower-cased mirrors for O(1) case-insensitive country lookups
+_COUNTRY_EQUITY_RISK_PREMIUMS_LOWER = {
+    key.lower(): value for key, value in COUNTRY_EQUITY_RISK_PREMIUMS.items()
+}
+_COUNTRY_GDP_GROWTH_LOWER = {key.lower(): value for key, value in COUNTRY_GDP_GROWTH.items()}
+
+
+def _extract_series(statements, key: str) -> list[float]:
+    """Pull one numeric field out of a list of statements, treating null as 0."""
+    return [stmt.get(key) or 0 for stmt in statements]
+
+
+def _average_pct_of_revenue(values: list[float], revenues: list[float]) -> float | None:
+    """
+    Average values / revenue over periods with positive revenue, as a percentage.
+
+    Returns None if no period has positive revenue.
+    """
+    ratios = [value / revenue for value, revenue in zip(values, revenues) if revenue > 0]
+    if not ratios:
+        return None
+    return round(sum(ratios) / len(ratios) * 100, 2)
+
 
 def calculate_revenue_growth_pct(
     income_statements: list[dict],
@@ -544,17 +827,13 @@ def calculate_revenue_growth_pct(
     statements = income_statements[:periods] if periods else income_statements
 
     # FMP API returns newest first, but CAGR needs oldest-to-newest
-    # CAGR = (Ending/Beginning)^(1/years) - 1
     # So we reverse to get: revenues[0]=oldest (beginning), revenues[-1]=newest (ending)
-    revenues = [stmt.get("revenue", 0) for stmt in reversed(statements)]
-    revenues = [r for r in revenues if r and r > 0]  # Filter out zeros/nulls
+    revenues = [r for r in _extract_series(reversed(statements), "revenue") if r > 0]
 
     if len(revenues) < 2:
         return 5.0  # Default 5% if insufficient data
 
-    years = len(revenues) - 1
-    cagr = (revenues[-1] / revenues[0]) ** (1 / years) - 1
-    return round(cagr * 100, 2)
+    return round(_calculate_historical_growth(revenues) * 100, 2)
 
 
 def calculate_capital_expenditure_pct(
@@ -575,20 +854,11 @@ def calculate_capital_expenditure_pct(
     Returns:
         CapEx as percentage of revenue (e.g., 5.2 for 5.2%)
     """
-    capex_pcts = []
-
-    for i in range(min(periods, len(cash_flows), len(income_statements))):
-        capex = abs(cash_flows[i].get("capitalExpenditure", 0) or 0)
-        revenue = income_statements[i].get("revenue", 0) or 0
-
-        if revenue > 0:
-            capex_pcts.append(capex / revenue)
+    capex = [abs(c) for c in _extract_series(cash_flows[:periods], "capitalExpenditure")]
+    revenues = _extract_series(income_statements[:periods], "revenue")
 
-    if not capex_pcts:
-        return 5.0  # Default 5% CapEx/Revenue
-
-    avg_pct = sum(capex_pcts) / len(capex_pcts)
-    return round(avg_pct * 100, 2)
+    avg_pct = _average_pct_of_revenue(capex, revenues)
+    return 5.0 if avg_pct is None else avg_pct  # Default 5% CapEx/Revenue
 
 
 def calculate_operating_cash_flow_pct(
@@ -607,20 +877,11 @@ def calculate_operating_cash_flow_pct(
     Returns:
         OCF as percentage of revenue (e.g., 25.0 for 25%)
     """
-    ocf_pcts = []
-
-    for i in range(min(periods, len(cash_flows), len(income_statements))):
-        ocf = cash_flows[i].get("operatingCashFlow", 0) or 0
-        revenue = income_statements[i].get("revenue", 0) or 0
-
-        if revenue > 0:
-            ocf_pcts.append(ocf / revenue)
-
-    if not ocf_pcts:
-        return 15.0  # Default 15% OCF/Revenue
+    ocf = _extract_series(cash_flows[:periods], "operatingCashFlow")
+    revenues = _extract_series(income_statements[:periods], "revenue")
 
-    avg_pct = sum(ocf_pcts) / len(ocf_pcts)
-    return round(avg_pct * 100, 2)
+    avg_pct = _average_pct_of_revenue(ocf, revenues)
+    return 15.0 if avg_pct is None else avg_pct  # Default 15% OCF/Revenue
 
 
 def calculate_market_risk_premium(country: str = "United States") -> float:
@@ -639,14 +900,10 @@ def calculate_market_risk_premium(country: str = "United States") -> float:
     if country in COUNTRY_EQUITY_RISK_PREMIUMS:
         return COUNTRY_EQUITY_RISK_PREMIUMS[country]
 
-    # Try case-insensitive match
-    country_lower = country.lower()
-    for key, value in COUNTRY_EQUITY_RISK_PREMIUMS.items():
-        if key.lower() == country_lower:
-            return value
-
-    # Default to US if country not found
-    return COUNTRY_EQUITY_RISK_PREMIUMS["United States"]
+    # Try case-insensitive match, defaulting to US if country not found
+    return _COUNTRY_EQUITY_RISK_PREMIUMS_LOWER.get(
+        country.lower(), COUNTRY_EQUITY_RISK_PREMIUMS["United States"]
+    )
 
 
 def calculate_long_term_growth_rate(country: str = "United States") -> float:
@@ -670,14 +927,8 @@ def calculate_long_term_growth_rate(country: str = "United States") -> float:
     if country in COUNTRY_GDP_GROWTH:
         return COUNTRY_GDP_GROWTH[country]
 
-    # Try case-insensitive match
-    country_lower = country.lower()
-    for key, value in COUNTRY_GDP_GROWTH.items():
-        if key.lower() == country_lower:
-            return value
-
-    # Default to US
-    return COUNTRY_GDP_GROWTH["United States"]
+    # Try case-insensitive match, defaulting to US
+    return _COUNTRY_GDP_GROWTH_LOWER.get(country.lower(), COUNTRY_GDP_GROWTH["United States"])
 
 
 def calculate_ebitda_pct(
@@ -694,16 +945,12 @@ def calculate_ebitda_pct(
     Returns:
         EBITDA margin as percentage (e.g., 25.0 for 25%)
     """
-    margins = []
-    for i in range(min(periods, len(income_statements))):
-        ebitda = income_statements[i].get("ebitda", 0) or 0
-        revenue = income_statements[i].get("revenue", 0) or 0
-        if revenue > 0:
-            margins.append(ebitda / revenue)
+    statements = income_statements[:periods]
+    ebitda = _extract_series(statements, "ebitda")
+    revenues = _extract_series(statements, "revenue")
 
-    if not margins:
-        return 15.0  # Default 15%
-    return round(sum(margins) / len(margins) * 100, 2)
+    avg_pct = _average_pct_of_revenue(ebitda, revenues)
+    return 15.0 if avg_pct is None else avg_pct  # Default 15%
 
 
 def _calculate_effective_tax_rate(income_statements: list[dict]) -> float:
@@ -738,9 +985,15 @@ def calculate_all_dcf_parameters(
     Returns:
         dict with all calculated parameters ready for get_custom_dcf()
     """
-    profile = get_company_profile(ticker)
-    income_stmts = get_income_statement(ticker, period="annual", limit=periods)
-    cash_flows = get_cash_flow(ticker, period="annual", limit=periods)
+    # Fetch data from FMP (independent requests, issued concurrently)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        profile_future = executor.submit(get_company_profile, ticker)
+        income_future = executor.submit(get_income_statement, ticker, period="annual", limit=periods)
+        cash_flow_future = executor.submit(get_cash_flow, ticker, period="annual", limit=periods)
+
+    profile = profile_future.result()
+    income_stmts = income_future.result()
+    cash_flows = cash_flow_future.result()
 
     # Calculate all parameters with consistent periods
     return {
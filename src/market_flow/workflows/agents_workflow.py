@@ -8,14 +8,15 @@ continues until approved or MAX_ITERATIONS is reached.
 Once approved or max iterations reached, the workflow generates a PDF report and uploads it to Google Drive.
 """
 
-import os
-import tempfile
+import asyncio
+import hashlib
 from datetime import datetime
+from functools import partial
 from typing import Callable
 
 from ..agents import FinancialModelingAgent, BossAgent
-from ..deep_research import _generate_pdf
-from ..drive_uploader import upload_to_drive as drive_upload
+from ..deep_research import _generate_pdf_bytes
+from ..drive_uploader import upload_bytes_to_drive
 
 # Google Drive folder IDs for traceability uploads
 MODELING_AGENT_FOLDER_ID = "1hw8m16wtxB4kTuoLil2y2jBhiOTvkxVQ"
@@ -28,9 +29,10 @@ def _upload_analysis_to_drive(
     folder_id: str,
     label: str = "analysis",
     on_status: Callable[[str], None] | None = None,
+    timestamp: str | None = None,
 ) -> dict:
     """
-    Generate PDF from content and upload to Google Drive, then delete local file.
+    Generate PDF from content in memory and upload it to Google Drive.
 
     Args:
         content: The analysis text to upload
@@ -38,25 +40,22 @@ def _upload_analysis_to_drive(
         folder_id: Google Drive folder ID
         label: Label for the file (e.g., "initial_analysis", "refinement_1")
         on_status: Optional status callback
+        timestamp: Timestamp for the file name (default: now, as YYYYMMDD_HHMMSS)
 
     Returns:
         dict with 'url' key containing the Google Drive URL
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    pdf_filename = f"{ticker.upper()}_{label}_{timestamp}.pdf"
-    pdf_path = os.path.join(tempfile.gettempdir(), pdf_filename)
-
-    _generate_pdf(content, pdf_path)
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    pdf_bytes = _generate_pdf_bytes(content)
 
     if on_status:
         on_status(f"Uploading {label.replace('_', ' ')} to Drive...")
 
-    drive_result = drive_upload(
-        file_path=pdf_path,
+    drive_result = upload_bytes_to_drive(
+        pdf_bytes,
+        file_name=f"{ticker.upper()} {label.replace('_', ' ').title()} - {timestamp}",
         folder_id=folder_id,
         convert_to_doc=True,
-        delete_local=True,  # Clean up local PDF after upload
-        file_name=f"{ticker.upper()} {label.replace('_', ' ').title()} - {timestamp}"
     )
 
     return {"url": drive_result["url"]}
@@ -92,8 +91,9 @@ async def run_agents_workflow(
             - iterations: Number of review iterations performed
             - review_history: List of review results from each iteration
             - drive_url: URL to the Google Drive file (if uploaded)
-            - pdf_path: None (local files are deleted after upload)
+            - pdf_path: None (PDFs are generated in memory; nothing is written locally)
             - analysis_urls: List of intermediate analysis uploads for traceability
+              (a failed upload has url None and the error message under "error")
 
     Example:
         >>> import asyncio
@@ -110,21 +110,43 @@ async def run_agents_workflow(
     modeling_agent = FinancialModelingAgent()
     boss_agent = BossAgent()
 
+    # One timestamp names every file this run uploads
+    workflow_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # Traceability uploads run on worker threads while the agents keep going.
+    # run_in_executor submits right away; the agents make blocking API calls,
+    # so a scheduled task would not start until the next real await.
+    # A refinement identical to an earlier draft reuses that draft's upload.
+    loop = asyncio.get_running_loop()
+    pending_uploads = []  # (iteration, type, future)
+    uploads_by_hash = {}
+
+    def _start_upload(content: str, label: str):
+        content_hash = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        upload = uploads_by_hash.get(content_hash)
+        if upload is None:
+            # Report the upload here, on the loop thread, when it is submitted
+            _status(f"Uploading {label.replace('_', ' ')} to Drive...")
+            upload = uploads_by_hash[content_hash] = loop.run_in_executor(
+                None,
+                partial(
+                    _upload_analysis_to_drive,
+                    content=content,
+                    ticker=ticker,
+                    folder_id=MODELING_AGENT_FOLDER_ID,
+                    label=label,
+                    timestamp=workflow_timestamp,
+                ),
+            )
+        return upload
+
     # Step 1: Initial analysis
     _status(f"Running initial analysis for {ticker}...")
     result = await modeling_agent.analyze(ticker)
     current_analysis = result["analysis"]
 
     # Upload initial analysis for traceability
-    analysis_urls = []
-    initial_upload = _upload_analysis_to_drive(
-        content=current_analysis,
-        ticker=ticker,
-        folder_id=MODELING_AGENT_FOLDER_ID,
-        label="initial_analysis",
-        on_status=_status,
-    )
-    analysis_urls.append({"iteration": 0, "type": "initial", "url": initial_upload["url"]})
+    pending_uploads.append((0, "initial", _start_upload(current_analysis, "initial_analysis")))
 
     review_history = []
     iteration = 0
@@ -160,14 +182,11 @@ async def run_agents_workflow(
         current_analysis = refined["analysis"]
 
         # Upload refinement for traceability
-        refinement_upload = _upload_analysis_to_drive(
-            content=current_analysis,
-            ticker=ticker,
-            folder_id=MODELING_AGENT_FOLDER_ID,
-            label=f"refinement_iteration_{iteration}",
-            on_status=_status,
-        )
-        analysis_urls.append({"iteration": iteration, "type": "refinement", "url": refinement_upload["url"]})
+        pending_uploads.append((
+            iteration,
+            "refinement",
+            _start_upload(current_analysis, f"refinement_iteration_{iteration}"),
+        ))
 
     # Build result dict
     workflow_result = {
@@ -178,7 +197,7 @@ async def run_agents_workflow(
         "review_history": review_history,
         "drive_url": None,
         "pdf_path": None,
-        "analysis_urls": analysis_urls,
+        "analysis_urls": [],
     }
 
     # Generate PDF and upload (either approved or max iterations reached)
@@ -186,27 +205,44 @@ async def run_agents_workflow(
         status_prefix = "approved" if workflow_result["approved"] else "max iterations reached"
         _status(f"Generating PDF report ({status_prefix})...")
 
-        # Generate PDF
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        pdf_filename = f"{ticker.upper()}_analysis_{timestamp}.pdf"
-        pdf_path = os.path.join(tempfile.gettempdir(), pdf_filename)
-
-        _generate_pdf(current_analysis, pdf_path)
+        # Generate PDF in memory
+        pdf_bytes = _generate_pdf_bytes(current_analysis)
 
         _status("Uploading to Google Drive...")
 
         # Upload to Drive
-        drive_result = drive_upload(
-            file_path=pdf_path,
+        drive_result = upload_bytes_to_drive(
+            pdf_bytes,
+            file_name=f"{ticker.upper()} Financial Analysis - {workflow_timestamp}",
             folder_id=folder_id,
             convert_to_doc=True,
-            delete_local=True,  # Clean up local PDF after upload
-            file_name=f"{ticker.upper()} Financial Analysis - {timestamp}"
         )
 
         workflow_result["drive_url"] = drive_result["url"]
         _status(f"Report uploaded: {drive_result['url']}")
 
+    # Wait for the traceability uploads to finish. The final report may
+    # already be in Drive, so a failed upload is recorded, not raised.
+    upload_results = await asyncio.gather(
+        *(future for _, _, future in pending_uploads),
+        return_exceptions=True,
+    )
+    for (upload_iteration, upload_type, _), upload in zip(pending_uploads, upload_results):
+        if isinstance(upload, BaseException):
+            _status(f"Traceability upload failed ({upload_type} {upload_iteration}): {upload}")
+            workflow_result["analysis_urls"].append({
+                "iteration": upload_iteration,
+                "type": upload_type,
+                "url": None,
+                "error": str(upload),
+            })
+        else:
+            workflow_result["analysis_urls"].append({
+                "iteration": upload_iteration,
+                "type": upload_type,
+                "url": upload["url"],
+            })
+
     return workflow_result
 
 
@@ -232,5 +268,4 @@ def run_agents_workflow_sync(
         >>> result = run_agents_workflow_sync("AAPL")
         >>> print(f"Approved: {result['approved']}")
     """
-    import asyncio
     return asyncio.run(run_agents_workflow(ticker, folder_id, upload_to_drive, on_status))
@@ -8,7 +8,17 @@ Orchestrates the complete DCF analysis pipeline:
 4. Generate report and upload to Google Drive
 """
 
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import fields
 from datetime import datetime
+from pathlib import Path
 from typing import Callable
 
 import tempfile
@@ -20,9 +30,104 @@ from ..market_data.fmp_client import (
 )
 from ..models.dcf_model import build_dcf_model, DCFResult
 from ..agents import analyze_dcf
-from ..drive_uploader import upload_to_drive
+from ..drive_uploader import upload_to_drive, _get_drive_service
 from ..deep_research import _generate_pdf
 
+logger = logging.getLogger(__name__)
+
+# How long to wait for the optional report data (profile, income, earnings)
+REPORT_DATA_TIMEOUT_SECONDS = 15
+
+# Report table headers (header row and separator)
+_FINANCIALS_HEADER = "| Year | Revenue | Net Income | EPS |\n|------|---------|------------|-----|"
+_PROJECTED_HEADER = "| Year | Projected FCF |\n|------|---------------|"
+_EARNINGS_HEADER = "| Date | EPS | EPS Est. | Surprise |\n|------|-----|----------|----------|"
+
+# Upside thresholds (%) and the verdict for each band, lowest band first.
+# An upside exactly on a threshold falls in the band below it.
+_VERDICT_THRESHOLDS = (-20, -5, 5, 20)
+_VERDICTS = (
+    ("OVERVALUED", "significant downside risk"),
+    ("SLIGHTLY OVERVALUED", "limited upside potential"),
+    ("FAIRLY VALUED", "trading near intrinsic value"),
+    ("SLIGHTLY UNDERVALUED", "modest upside potential"),
+    ("UNDERVALUED", "significant upside potential"),
+)
+
+# Fetched data, DCF result and Claude analysis for same-day re-runs
+DCF_CACHE_DIR = Path.home() / ".cache" / "market_flow" / "dcf"
+
+# Tickers safe to use in a cache file name; other symbols are not cached
+_CACHEABLE_TICKER = re.compile(r"[A-Z0-9.-]+")
+
+# Runs report uploads for run_dcf_analysis(async_upload=True)
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dcf-upload")
+
+
+def _artifact_cache_path(
+    ticker: str,
+    projection_years: int,
+    terminal_growth_rate: float,
+) -> Path | None:
+    """
+    Cache file for a ticker's artifacts from today's run with these assumptions.
+
+    Returns None if the ticker is not a plain symbol ([A-Z0-9.-]), so user
+    input can never point the cache outside DCF_CACHE_DIR.
+    """
+    if not _CACHEABLE_TICKER.fullmatch(ticker):
+        return None
+    today = datetime.now().strftime("%Y-%m-%d")
+    return DCF_CACHE_DIR / f"{ticker}_{today}_{projection_years}y_{terminal_growth_rate:g}.json"
+
+
+def _dcf_result_to_json(dcf_result: DCFResult) -> dict:
+    """Convert a DCFResult to JSON-compatible constructor arguments."""
+    data = {f.name: getattr(dcf_result, f.name) for f in fields(dcf_result)}
+    data["historical_fcf"] = list(dcf_result.historical_fcf)
+    return data
+
+
+def _dcf_result_from_json(data: dict) -> DCFResult:
+    """Rebuild a DCFResult from _dcf_result_to_json output."""
+    return DCFResult(**{
+        **data,
+        "historical_fcf": tuple(data["historical_fcf"]),
+    })
+
+
+def _load_artifacts(path: Path) -> dict | None:
+    """Load cached artifacts; a missing or unreadable file is a cache miss."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            artifacts = json.load(f)
+        artifacts["dcf_result"] = _dcf_result_from_json(artifacts["dcf_result"])
+        return artifacts
+    except Exception:
+        return None
+
+
+def _save_artifacts(path: Path, artifacts: dict) -> None:
+    """
+    Write artifacts atomically and remove files from earlier days, which can
+    no longer be hit. Failing to cache never fails the workflow.
+    """
+    payload = {**artifacts, "dcf_result": _dcf_result_to_json(artifacts["dcf_result"])}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+
+        # File names are {ticker}_{date}_..., see _artifact_cache_path
+        today = path.name.split("_")[1]
+        for cached_path in path.parent.glob("*_*_*.json"):
+            if cached_path.name.split("_")[1] != today:
+                cached_path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
 
 def _format_dcf_report(
     ticker: str,
@@ -48,60 +153,59 @@ def _format_dcf_report(
     """
     today = datetime.now().strftime("%B %d, %Y")
 
-    # Format historical financials table
-    financials_table = "| Year | Revenue | Net Income | EPS |\n"
-    financials_table += "|------|---------|------------|-----|\n"
+    # Format historical financials table (rows are joined once per table)
+    rows = [_FINANCIALS_HEADER]
     for stmt in income_statements[:5]:
         year = stmt.get("calendarYear", "N/A")
         revenue = stmt.get("revenue", 0)
         net_income = stmt.get("netIncome", 0)
         eps = stmt.get("epsdiluted", 0)
-        financials_table += f"| {year} | ${revenue/1e9:.2f}B | ${net_income/1e9:.2f}B | ${eps:.2f} |\n"
+        rows.append(f"| {year} | ${revenue/1e9:.2f}B | ${net_income/1e9:.2f}B | ${eps:.2f} |")
+    financials_table = "\n".join(rows) + "\n"
 
     # Format projected FCF table
-    projected_table = "| Year | Projected FCF |\n"
-    projected_table += "|------|---------------|\n"
+    rows = [_PROJECTED_HEADER]
     for i, fcf in enumerate(dcf_result.projected_fcfs):
-        projected_table += f"| Year {i+1} | ${fcf/1e6:.1f}M |\n"
-
-    # Format sensitivity matrix
-    sensitivity_table = "| WACC \\ Growth |"
-    growth_rates = list(list(dcf_result.sensitivity_matrix.values())[0].keys())
-    sensitivity_table += " | ".join(growth_rates) + " |\n"
-    sensitivity_table += "|" + "---|" * (len(growth_rates) + 1) + "\n"
-
-    for wacc_key, growth_dict in dcf_result.sensitivity_matrix.items():
-        row = f"| {wacc_key} |"
-        row += " | ".join(f"${v:.2f}" for v in growth_dict.values())
-        sensitivity_table += row + " |\n"
+        rows.append(f"| Year {i+1} | ${fcf/1e6:.1f}M |")
+    projected_table = "\n".join(rows) + "\n"
+
+    # Format sensitivity matrix (empty when the model skipped it)
+    if dcf_result.sensitivity_matrix:
+        # Column order comes from the first row and is applied to every row
+        growth_keys = tuple(next(iter(dcf_result.sensitivity_matrix.values())))
+        rows = [
+            "| WACC \\ Growth |" + " | ".join(growth_keys) + " |",
+            "|" + "---|" * (len(growth_keys) + 1),
+        ]
+        for wacc_key, growth_dict in dcf_result.sensitivity_matrix.items():
+            values = " | ".join(f"${growth_dict[k]:.2f}" for k in growth_keys)
+            rows.append(f"| {wacc_key} |{values} |")
+        sensitivity_table = "\n".join(rows) + "\n"
+    else:
+        sensitivity_table = "Sensitivity analysis was not computed for this model.\n"
 
     # Format recent earnings
-    earnings_table = "| Date | EPS | EPS Est. | Surprise |\n"
-    earnings_table += "|------|-----|----------|----------|\n"
+    rows = [_EARNINGS_HEADER]
     for earn in earnings_history[:8]:
         date = earn.get("date", "N/A")
-        eps = earn.get("eps", 0) or 0
-        eps_est = earn.get("epsEstimated", 0) or 0
-        surprise = ((eps - eps_est) / eps_est * 100) if eps_est else 0
-        surprise_str = f"{surprise:+.1f}%" if eps_est else "N/A"
-        earnings_table += f"| {date} | ${eps:.2f} | ${eps_est:.2f} | {surprise_str} |\n"
+        eps = earn.get("eps") or 0
+        eps_est = earn.get("epsEstimated") or 0
+        # No estimate means no surprise to report (and nothing to divide by)
+        surprise_str = f"{(eps - eps_est) / eps_est * 100:+.1f}%" if eps_est else "N/A"
+        rows.append(f"| {date} | ${eps:.2f} | ${eps_est:.2f} | {surprise_str} |")
+    earnings_table = "\n".join(rows) + "\n"
 
     # Valuation verdict
-    if dcf_result.upside_percentage > 20:
-        verdict = "UNDERVALUED"
-        verdict_color = "significant upside potential"
-    elif dcf_result.upside_percentage > 5:
-        verdict = "SLIGHTLY UNDERVALUED"
-        verdict_color = "modest upside potential"
-    elif dcf_result.upside_percentage > -5:
-        verdict = "FAIRLY VALUED"
-        verdict_color = "trading near intrinsic value"
-    elif dcf_result.upside_percentage > -20:
-        verdict = "SLIGHTLY OVERVALUED"
-        verdict_color = "limited upside potential"
-    else:
-        verdict = "OVERVALUED"
-        verdict_color = "significant downside risk"
+    verdict, verdict_color = _VERDICTS[bisect_left(_VERDICT_THRESHOLDS, dcf_result.upside_percentage)]
+
+    # Business description, capped at 800 characters
+    description = profile.get("description") or "N/A"
+    if len(description) > 800:
+        description = description[:800]
+
+    # Derived figures shown in the report
+    after_tax_cost_of_debt = dcf_result.cost_of_debt * (1 - dcf_result.tax_rate)
+    equity_value = dcf_result.enterprise_value - dcf_result.net_debt
 
     report = f"""# DCF Valuation Analysis: {dcf_result.company_name} ({ticker})
 
@@ -129,7 +233,7 @@ def _format_dcf_report(
 | **Beta** | {profile.get('beta', 'N/A')} |
 
 **Business Description:**
-{profile.get('description', 'N/A')[:800]}
+{description}
 
 ---
 
@@ -147,7 +251,7 @@ def _format_dcf_report(
 |------------|-------|
 | **WACC** | {dcf_result.wacc:.2%} |
 | **Cost of Equity** | {dcf_result.cost_of_equity:.2%} |
-| **Cost of Debt (after-tax)** | {dcf_result.cost_of_debt * (1 - dcf_result.tax_rate):.2%} |
+| **Cost of Debt (after-tax)** | {after_tax_cost_of_debt:.2%} |
 | **Debt/Capital** | {dcf_result.debt_weight:.1%} |
 | **Tax Rate** | {dcf_result.tax_rate:.1%} |
 | **FCF Growth Rate** | {dcf_result.revenue_growth_rate:.1%} |
@@ -165,7 +269,7 @@ def _format_dcf_report(
 | **Terminal Value** | ${dcf_result.terminal_value/1e9:.2f}B |
 | **Enterprise Value** | ${dcf_result.enterprise_value/1e9:.2f}B |
 | **Net Debt** | ${dcf_result.net_debt/1e9:.2f}B |
-| **Equity Value** | ${(dcf_result.enterprise_value - dcf_result.net_debt)/1e9:.2f}B |
+| **Equity Value** | ${equity_value/1e9:.2f}B |
 | **Shares Outstanding** | {dcf_result.shares_outstanding/1e6:.1f}M |
 | **Intrinsic Value/Share** | ${dcf_result.intrinsic_value:.2f} |
 
@@ -203,12 +307,50 @@ This analysis is for informational purposes only and does not constitute investm
     return report
 
 
+def _start_status_worker(
+    on_status: Callable[[str], None] | None,
+) -> tuple[Callable[[str], None], Callable[[], None]]:
+    """
+    Deliver status messages to on_status from a background thread.
+
+    A slow callback (e.g. one pushing to a UI) then never holds up the
+    workflow. Messages are delivered in order.
+
+    Returns:
+        (status, close): status queues a message; close delivers any
+        queued messages and stops the thread (waiting at most 5 seconds)
+    """
+    if on_status is None:
+        return (lambda msg: None), (lambda: None)
+
+    messages: queue.Queue[str | None] = queue.Queue()
+
+    def _deliver():
+        while (msg := messages.get()) is not None:
+            try:
+                on_status(msg)
+            except Exception:
+                # A failing callback must not stop later updates
+                logger.exception("on_status callback failed for message %r", msg)
+
+    worker = threading.Thread(target=_deliver, name="dcf-status", daemon=True)
+    worker.start()
+
+    def _close():
+        messages.put(None)
+        worker.join(timeout=5)
+
+    return messages.put_nowait, _close
+
+
 def run_dcf_analysis(
     ticker: str,
     drive_folder_id: str | None = None,
     projection_years: int = 5,
     terminal_growth_rate: float = 0.025,
     on_status: Callable[[str], None] | None = None,
+    use_cache: bool = False,
+    async_upload: bool = False,
 ) -> dict:
     """
     Run the complete DCF analysis workflow.
@@ -225,7 +367,21 @@ def run_dcf_analysis(
         drive_folder_id: Google Drive folder ID to upload to (None = root)
         projection_years: Number of years to project (default: 5)
         terminal_growth_rate: Long-term growth rate (default: 2.5%)
-        on_status: Optional callback for status updates
+        on_status: Optional callback for status updates. It is called in order
+                   from a background "dcf-status" thread, so it must be safe to
+                   call off the caller's thread. Exceptions it raises are logged
+                   and do not stop the workflow. Messages can arrive after this
+                   function returns: a slow callback gets up to 5 more seconds
+                   to catch up, and with async_upload the upload's messages
+                   follow as it runs.
+        use_cache: Reuse today's fetched data, model and Claude analysis for
+                   this ticker and these assumptions if available (default: False).
+                   A cached run reports the earlier run's price, upside and
+                   Claude analysis, which can be up to a day old.
+                   A cache hit also reuses the stored report text; only the
+                   PDF is regenerated and uploaded.
+        async_upload: Generate the PDF and upload it in the background and
+                      return without waiting for the Google Doc (default: False)
 
     Returns:
         dict with:
@@ -233,83 +389,162 @@ def run_dcf_analysis(
             - intrinsic_value: Calculated intrinsic value per share
             - current_price: Current stock price
             - upside_percentage: Potential upside/downside
-            - google_doc_url: URL to the generated Google Doc
+            - google_doc_url: URL to the generated Google Doc (None if async_upload)
+            - google_doc_url_future: Future resolving to the Google Doc URL
+              (only if async_upload)
             - dcf_result: Full DCFResult object
     """
     ticker = ticker.upper()
 
-    def _status(msg: str):
-        if on_status:
-            on_status(msg)
-
-    _status(f"Starting DCF analysis for {ticker}...")
-
-    # Step 1: Fetch company data
-    _status("Fetching company profile...")
-    profile = get_company_profile(ticker)
-
-    _status("Fetching income statements...")
-    income_statements = get_income_statement(ticker, period="annual", limit=5)
-
-    _status("Fetching earnings history...")
-    earnings_history = get_earnings_history(ticker, limit=20)
-
-    # Step 2: Build DCF model
-    _status("Building DCF model...")
-    dcf_result = build_dcf_model(
-        ticker=ticker,
-        projection_years=projection_years,
-        terminal_growth_rate=terminal_growth_rate,
-    )
-    _status(f"DCF complete: Intrinsic value = ${dcf_result.intrinsic_value:.2f}")
-
-    # Step 3: Claude analysis
-    _status("Running AI analysis with Claude...")
-    claude_analysis = analyze_dcf(
-        dcf_result=dcf_result,
-        company_context={"profile": profile},
-    )
-    _status("AI analysis complete")
-
-    # Step 4: Generate report
-    _status("Generating report...")
-    report_content = _format_dcf_report(
-        ticker=ticker,
-        dcf_result=dcf_result,
-        claude_analysis=claude_analysis,
-        profile=profile,
-        income_statements=income_statements,
-        earnings_history=earnings_history,
-    )
-
-    # Step 5: Generate PDF and upload to Google Drive
-    _status("Generating PDF...")
-    doc_title = f"DCF Analysis - {dcf_result.company_name} ({ticker})"
-
-    # Create a temporary PDF file
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-        pdf_path = tmp.name
-
-    _generate_pdf(report_content, pdf_path)
-    _status("PDF generated, uploading to Google Drive...")
-
-    # Upload to Drive and convert to Google Doc
-    result = upload_to_drive(
-        file_path=pdf_path,
-        folder_id=drive_folder_id,
-        convert_to_doc=True,
-        delete_local=True,
-        file_name=doc_title,
-    )
-    doc_url = result["url"]
-    _status(f"Google Doc created: {doc_url}")
-
-    return {
-        "ticker": ticker,
-        "company_name": dcf_result.company_name,
-        "intrinsic_value": dcf_result.intrinsic_value,
-        "current_price": dcf_result.current_price,
-        "upside_percentage": dcf_result.upside_percentage,
-        "google_doc_url": doc_url,
-        "dcf_result": dcf_result,
-    }
+    _status, _close_status = _start_status_worker(on_status)
+    upload_future = None
+    try:
+        _status(f"Starting DCF analysis for {ticker}...")
+
+        cache_path = _artifact_cache_path(ticker, projection_years, terminal_growth_rate)
+        artifacts = _load_artifacts(cache_path) if use_cache and cache_path else None
+        drive_service_future = None
+        cacheable = True
+
+        if artifacts:
+            _status("Using today's cached data and analysis...")
+            profile = artifacts["profile"]
+            income_statements = artifacts["income_statements"]
+            earnings_history = artifacts["earnings_history"]
+            dcf_result = artifacts["dcf_result"]
+            claude_analysis = artifacts["claude_analysis"]
+            report_content = artifacts.get("report_content")
+        else:
+            # Steps 1-2: Fetch report data and build the DCF model concurrently;
+            # the model's own FMP requests overlap with the report fetches
+            _status("Fetching company data and building DCF model...")
+            executor = ThreadPoolExecutor(max_workers=4)
+            try:
+                profile_future = executor.submit(get_company_profile, ticker)
+                income_future = executor.submit(get_income_statement, ticker, period="annual", limit=5)
+                earnings_future = executor.submit(get_earnings_history, ticker, limit=20)
+                dcf_future = executor.submit(
+                    build_dcf_model,
+                    ticker=ticker,
+                    projection_years=projection_years,
+                    terminal_growth_rate=terminal_growth_rate,
+                )
+
+                # The model is required; report data that is still outstanding
+                # after the timeout (and after the model) is left out
+                wait(
+                    [profile_future, income_future, earnings_future],
+                    timeout=REPORT_DATA_TIMEOUT_SECONDS,
+                )
+                dcf_result = dcf_future.result()
+
+                pending = {
+                    future for future in (profile_future, income_future, earnings_future)
+                    if not future.done()
+                }
+                profile = {} if profile_future in pending else profile_future.result()
+                income_statements = [] if income_future in pending else income_future.result()
+                earnings_history = [] if earnings_future in pending else earnings_future.result()
+            finally:
+                # Don't wait on a stuck request; its thread finishes on its own
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            if pending:
+                missing = [
+                    name for name, future in (
+                        ("company profile", profile_future),
+                        ("income statements", income_future),
+                        ("earnings history", earnings_future),
+                    )
+                    if future in pending
+                ]
+                _status(f"Continuing without {', '.join(missing)} (timed out)")
+                cacheable = False
+
+            _status(f"DCF complete: Intrinsic value = ${dcf_result.intrinsic_value:.2f}")
+
+            # Step 3: Claude analysis; the Drive client is built meanwhile so
+            # the upload finds it ready
+            _status("Running AI analysis with Claude...")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                drive_service_future = executor.submit(_get_drive_service)
+                claude_analysis = analyze_dcf(
+                    dcf_result=dcf_result,
+                    company_context={"profile": profile},
+                )
+            _status("AI analysis complete")
+            report_content = None
+
+        # Step 4: Generate report (a same-day cached report is reused as is)
+        if report_content is None:
+            _status("Generating report...")
+            report_content = _format_dcf_report(
+                ticker=ticker,
+                dcf_result=dcf_result,
+                claude_analysis=claude_analysis,
+                profile=profile,
+                income_statements=income_statements,
+                earnings_history=earnings_history,
+            )
+
+            # Persist before uploading so a failed upload can be retried cheaply;
+            # a report missing timed-out data is not reused
+            if use_cache and cacheable and cache_path:
+                _save_artifacts(cache_path, {
+                    "profile": profile,
+                    "income_statements": income_statements,
+                    "earnings_history": earnings_history,
+                    "dcf_result": dcf_result,
+                    "claude_analysis": claude_analysis,
+                    "report_content": report_content,
+                })
+
+        # Step 5: Generate PDF and upload to Google Drive
+        def _upload_report() -> str:
+            _status("Generating PDF...")
+            doc_title = f"DCF Analysis - {dcf_result.company_name} ({ticker})"
+
+            # Create a temporary PDF file
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+                pdf_path = tmp.name
+
+            _generate_pdf(report_content, pdf_path)
+            _status("PDF generated, uploading to Google Drive...")
+
+            # Upload to Drive and convert to Google Doc
+            result = upload_to_drive(
+                file_path=pdf_path,
+                folder_id=drive_folder_id,
+                convert_to_doc=True,
+                delete_local=True,
+                file_name=doc_title,
+                service=drive_service_future.result() if drive_service_future else None,
+            )
+            doc_url = result["url"]
+            _status(f"Google Doc created: {doc_url}")
+            return doc_url
+
+        if async_upload:
+            upload_future = _UPLOAD_EXECUTOR.submit(_upload_report)
+            doc_url = None
+        else:
+            doc_url = _upload_report()
+
+        result = {
+            "ticker": ticker,
+            "company_name": dcf_result.company_name,
+            "intrinsic_value": dcf_result.intrinsic_value,
+            "current_price": dcf_result.current_price,
+            "upside_percentage": dcf_result.upside_percentage,
+            "google_doc_url": doc_url,
+            "dcf_result": dcf_result,
+        }
+        if upload_future is not None:
+            result["google_doc_url_future"] = upload_future
+        return result
+    finally:
+        # A background upload still reports status; close once it finishes
+        if upload_future is not None:
+            upload_future.add_done_callback(lambda _: _close_status())
+        else:
+            _close_status()